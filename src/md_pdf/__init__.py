@@ -1,14 +1,28 @@
 """md-pdf: Convert Markdown to PDF with GitHub-like rendering."""
 
+from __future__ import annotations
+
 import argparse
+import functools
 import logging
+import mmap
+import multiprocessing.util
+import os
+import re
+import shutil
+import stat
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import markdown
-from pygments.formatters import HtmlFormatter
-from weasyprint import CSS, HTML
-from weasyprint.text.fonts import FontConfiguration
+# markdown, pygments and weasyprint are imported where they are first used so
+# that argument parsing and error paths do not pay their startup cost.
+if TYPE_CHECKING:
+    import markdown
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
 
 # ---------------------------------------------------------------------------
 # Markdown extensions
@@ -31,16 +45,63 @@ _MARKDOWN_EXTENSION_CONFIGS = {
     "codehilite": {
         "css_class": "codehilite",
         "linenums": False,
-        "guess_lang": True,
+        "guess_lang": False,
     },
     "toc": {"permalink": False},
 }
 
+
+# Markdown parsers keep per-document state between reset() and convert(), so
+# each thread gets its own set rather than sharing one across the process.
+_MARKDOWN_PARSERS = threading.local()
+
+
+def _get_markdown(highlight: bool, guess_lang: bool) -> markdown.Markdown:
+    """Return this thread's cached Markdown parser; call ``reset()`` before use."""
+    parsers = getattr(_MARKDOWN_PARSERS, "by_key", None)
+    if parsers is None:
+        parsers = _MARKDOWN_PARSERS.by_key = {}
+    key = (highlight, guess_lang)
+    if key not in parsers:
+        parsers[key] = _build_markdown(highlight, guess_lang)
+    return parsers[key]
+
+
+def _build_markdown(highlight: bool, guess_lang: bool) -> markdown.Markdown:
+    """Build a Markdown parser with the configured extensions.
+
+    With ``highlight`` disabled, ``codehilite`` is left out and fenced code
+    blocks are emitted as plain ``<pre><code>`` without running Pygments.
+    ``guess_lang`` lets Pygments guess the lexer for unlabeled code blocks.
+    """
+    import markdown
+
+    extensions = _MARKDOWN_EXTENSIONS
+    extension_configs = _MARKDOWN_EXTENSION_CONFIGS
+    if guess_lang:
+        extension_configs = {
+            **extension_configs,
+            "codehilite": {**extension_configs["codehilite"], "guess_lang": True},
+        }
+    if not highlight:
+        extensions = [ext for ext in extensions if ext != "codehilite"]
+        extension_configs = {
+            name: config for name, config in extension_configs.items() if name != "codehilite"
+        }
+    return markdown.Markdown(
+        extensions=extensions,
+        extension_configs=extension_configs,
+    )
+
+
 # ---------------------------------------------------------------------------
 # CSS — structural (mode-independent)
 # ---------------------------------------------------------------------------
 
-GITHUB_CSS_BASE = """
+# Split into modules so convert() only hands WeasyPrint the rules whose
+# elements actually occur in the rendered document.
+
+_CSS_CORE = """
 * {
     box-sizing: border-box;
     margin: 0;
@@ -79,21 +140,6 @@ a {
     text-decoration: none;
 }
 
-ul, ol {
-    margin-top: 0;
-    margin-bottom: 16px;
-    padding-left: 2em;
-}
-
-li {
-    margin-top: 4px;
-}
-
-ul ul, ul ol, ol ul, ol ol {
-    margin-top: 0;
-    margin-bottom: 0;
-}
-
 blockquote {
     margin: 0 0 16px 0;
     padding: 0 1em;
@@ -111,6 +157,33 @@ hr {
     border: 0;
 }
 
+strong { font-weight: 600; }
+em     { font-style: italic; }
+del    { text-decoration: line-through; }
+
+/* Page break helpers */
+h1, h2, h3 { page-break-after: avoid; }
+blockquote { page-break-inside: avoid; }
+"""
+
+_CSS_LISTS = """
+ul, ol {
+    margin-top: 0;
+    margin-bottom: 16px;
+    padding-left: 2em;
+}
+
+li {
+    margin-top: 4px;
+}
+
+ul ul, ul ol, ol ul, ol ol {
+    margin-top: 0;
+    margin-bottom: 0;
+}
+"""
+
+_CSS_CODE = """
 /* Inline code */
 code {
     font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, monospace;
@@ -161,6 +234,10 @@ pre code {
     padding: 16px;
 }
 
+pre { page-break-inside: avoid; }
+"""
+
+_CSS_TABLES = """
 /* Tables */
 table {
     width: 100%;
@@ -187,15 +264,17 @@ th {
     font-weight: 600;
 }
 
+table { page-break-inside: avoid; }
+"""
+
+_CSS_IMG = """
 img {
     max-width: 100%;
     height: auto;
 }
+"""
 
-strong { font-weight: 600; }
-em     { font-style: italic; }
-del    { text-decoration: line-through; }
-
+_CSS_DL = """
 dt {
     font-weight: bold;
     margin-top: 8px;
@@ -205,7 +284,9 @@ dd {
     margin-left: 2em;
     margin-bottom: 4px;
 }
+"""
 
+_CSS_FOOTNOTE = """
 .footnote {
     font-size: 85%;
     border-top-width: 1px;
@@ -213,12 +294,12 @@ dd {
     margin-top: 32px;
     padding-top: 16px;
 }
-
-/* Page break helpers */
-h1, h2, h3          { page-break-after: avoid; }
-pre, blockquote, table { page-break-inside: avoid; }
 """
 
+GITHUB_CSS_BASE = "".join(
+    [_CSS_CORE, _CSS_LISTS, _CSS_CODE, _CSS_TABLES, _CSS_IMG, _CSS_DL, _CSS_FOOTNOTE]
+)
+
 # ---------------------------------------------------------------------------
 # CSS — light mode colors (DEFAULT)
 # ---------------------------------------------------------------------------
@@ -309,6 +390,26 @@ th { background-color: #161b22; }
 .footnote { border-top-color: #30363d; }
 """
 
+# ---------------------------------------------------------------------------
+# Mode and page size lookup tables
+# ---------------------------------------------------------------------------
+
+_THEME_CSS = {"LIGHT": GITHUB_CSS_LIGHT, "DARK": GITHUB_CSS_DARK}
+_PYGMENTS_STYLE = {"LIGHT": "default", "DARK": "github-dark"}
+_PAGE_SIZE = {"LETTER": "letter", "A4": "A4"}
+
+# Optional base modules, in cascade order, with the HTML markers that signal
+# the document needs them. Raw HTML is passed through unchanged, so the
+# markers match case-insensitively.
+_OPTIONAL_CSS = [
+    (re.compile(r"<(?:ul|ol)\b", re.IGNORECASE), _CSS_LISTS),
+    (re.compile(r"<(?:code|pre)\b", re.IGNORECASE), _CSS_CODE),
+    (re.compile(r"<table\b", re.IGNORECASE), _CSS_TABLES),
+    (re.compile(r"<img\b", re.IGNORECASE), _CSS_IMG),
+    (re.compile(r"<dl\b", re.IGNORECASE), _CSS_DL),
+    (re.compile(r"""class=["']footnote["']""", re.IGNORECASE), _CSS_FOOTNOTE),
+]
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -316,73 +417,151 @@ th { background-color: #161b22; }
 _FONTS_DIR = Path(__file__).parent / "fonts"
 
 
+@functools.cache
+def _css(stylesheet: str) -> CSS:
+    """Return a parsed stylesheet, shared by every conversion in the process."""
+    from weasyprint import CSS
+
+    return CSS(string=stylesheet)
+
+
 # Unicode ranges that cover emoji and symbol blocks.
-_EMOJI_UNICODE_RANGE = (
-    "U+200D, U+203C, U+2049, U+20E3, "
-    "U+2122, U+2139, U+2194-2199, U+21A9-21AA, "
-    "U+231A-231B, U+2328, U+23CF, U+23E9-23F3, U+23F8-23FA, "
-    "U+24C2, U+25AA-25AB, U+25B6, U+25C0, U+25FB-25FE, "
-    "U+2600-2604, U+260E, U+2611, U+2614-2615, U+2618, U+261D, "
-    "U+2620, U+2622-2623, U+2626, U+262A, U+262E-262F, "
-    "U+2638-263A, U+2640, U+2642, U+2648-2653, U+265F-2660, "
-    "U+2663, U+2665-2666, U+2668, U+267B, U+267E-267F, "
-    "U+2692-2697, U+2699, U+269B-269C, U+26A0-26A1, U+26A7, "
-    "U+26AA-26AB, U+26B0-26B1, U+26BD-26BE, U+26C4-26C5, "
-    "U+26CE-26CF, U+26D1, U+26D3-26D4, U+26E9-26EA, "
-    "U+26F0-26F5, U+26F7-26FA, U+26FD, U+2702, U+2705, "
-    "U+2708-270D, U+270F, U+2712, U+2714, U+2716, U+271D, "
-    "U+2721, U+2728, U+2733-2734, U+2744, U+2747, U+274C, "
-    "U+274E, U+2753-2755, U+2757, U+2763-2764, U+2795-2797, "
-    "U+27A1, U+27B0, U+27BF, U+2934-2935, U+2B05-2B07, "
-    "U+2B1B-2B1C, U+2B50, U+2B55, U+3030, U+303D, "
-    "U+3297, U+3299, "
-    "U+FE00-FE0F, "
-    "U+1F000-1F02F, U+1F0A0-1F0FF, "
-    "U+1F100-1F1FF, U+1F200-1F2FF, "
-    "U+1F300-1F5FF, U+1F600-1F64F, U+1F650-1F6FF, "
-    "U+1F700-1F77F, U+1F780-1F7FF, U+1F800-1F8FF, "
-    "U+1F900-1F9FF, U+1FA00-1FA6F, U+1FA70-1FAFF"
-)
+#
+# The emoji font is deliberately not subset to these ranges ahead of time:
+# they already cover almost every code point in NotoColorEmoji, and most of
+# the file is the SVG glyph table WeasyPrint draws emoji from, so a subset is
+# under 1% smaller. WeasyPrint subsets embedded fonts to the used glyphs.
+_EMOJI_UNICODE_RANGE = """\
+U+200D, U+203C, U+2049, U+20E3,
+U+2122, U+2139, U+2194-2199, U+21A9-21AA,
+U+231A-231B, U+2328, U+23CF, U+23E9-23F3, U+23F8-23FA,
+U+24C2, U+25AA-25AB, U+25B6, U+25C0, U+25FB-25FE,
+U+2600-2604, U+260E, U+2611, U+2614-2615, U+2618, U+261D,
+U+2620, U+2622-2623, U+2626, U+262A, U+262E-262F,
+U+2638-263A, U+2640, U+2642, U+2648-2653, U+265F-2660,
+U+2663, U+2665-2666, U+2668, U+267B, U+267E-267F,
+U+2692-2697, U+2699, U+269B-269C, U+26A0-26A1, U+26A7,
+U+26AA-26AB, U+26B0-26B1, U+26BD-26BE, U+26C4-26C5,
+U+26CE-26CF, U+26D1, U+26D3-26D4, U+26E9-26EA,
+U+26F0-26F5, U+26F7-26FA, U+26FD, U+2702, U+2705,
+U+2708-270D, U+270F, U+2712, U+2714, U+2716, U+271D,
+U+2721, U+2728, U+2733-2734, U+2744, U+2747, U+274C,
+U+274E, U+2753-2755, U+2757, U+2763-2764, U+2795-2797,
+U+27A1, U+27B0, U+27BF, U+2934-2935, U+2B05-2B07,
+U+2B1B-2B1C, U+2B50, U+2B55, U+3030, U+303D,
+U+3297, U+3299,
+U+FE00-FE0F,
+U+1F000-1F02F, U+1F0A0-1F0FF,
+U+1F100-1F1FF, U+1F200-1F2FF,
+U+1F300-1F5FF, U+1F600-1F64F, U+1F650-1F6FF,
+U+1F700-1F77F, U+1F780-1F7FF, U+1F800-1F8FF,
+U+1F900-1F9FF, U+1FA00-1FA6F, U+1FA70-1FAFF"""
+
+
+_FONT_FACE_TEMPLATE = '@font-face {{ font-family: "{}"; src: url("{}");{} }}'
+_EMOJI_UNICODE_RANGE_DECL = " unicode-range: " + _EMOJI_UNICODE_RANGE + ";"
 
 
 def _font_face_css() -> str:
     """Return @font-face rules for bundled fonts."""
+    template = _FONT_FACE_TEMPLATE.format
     rules = []
     for ttf in sorted(_FONTS_DIR.glob("*.ttf")):
         stem = ttf.stem  # e.g. "NotoEmoji-Regular"
         family = stem.split("-")[0]
         is_emoji = "emoji" in family.lower()
-        unicode_range = f" unicode-range: {_EMOJI_UNICODE_RANGE};" if is_emoji else ""
-        rules.append(
-            f'@font-face {{ font-family: "{family}"; src: url("{ttf.as_uri()}");{unicode_range} }}'
-        )
+        unicode_range = _EMOJI_UNICODE_RANGE_DECL if is_emoji else ""
+        rules.append(template(family, ttf.as_uri(), unicode_range))
     return "\n".join(rules)
 
 
+# The bundled fonts never change at runtime, so the rules are built once.
+_FONT_FACE_CSS_STRING = _font_face_css()
+
+
+def _font_css(font_config: FontConfiguration) -> CSS:
+    """Return the bundled @font-face stylesheet, registered with ``font_config``.
+
+    WeasyPrint skips copying a font into a configuration that already holds
+    it, so reusing a configuration only pays for parsing these few rules.
+    """
+    from weasyprint import CSS
+
+    return CSS(string=_FONT_FACE_CSS_STRING, font_config=font_config)
+
+
+@functools.lru_cache(maxsize=2)
 def _get_pygments_css(mode: str) -> str:
     """Generate Pygments CSS for the given mode."""
-    style = "default" if mode == "LIGHT" else "github-dark"
-    formatter = HtmlFormatter(style=style, cssclass="codehilite")
+    from pygments.formatters import HtmlFormatter
+
+    formatter = HtmlFormatter(style=_PYGMENTS_STYLE[mode], cssclass="codehilite")
     return formatter.get_style_defs(".codehilite")
 
 
-def _build_html(body_html: str, pygments_css: str, mode: str, size: str, margin: float) -> str:
-    """Assemble a complete HTML document with all styles inlined."""
-    theme_css = GITHUB_CSS_LIGHT if mode == "LIGHT" else GITHUB_CSS_DARK
-    page_size = "letter" if size == "LETTER" else "A4"
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<style>@page {{ size: {page_size}; margin: {margin}in; }}</style>
-<style>{GITHUB_CSS_BASE}</style>
-<style>{theme_css}</style>
-<style>{pygments_css}</style>
-</head>
-<body>
-{body_html}
-</body>
-</html>"""
+@functools.lru_cache(maxsize=2)
+def _pygments_css_obj(mode: str) -> CSS:
+    """Return the parsed Pygments stylesheet for the given mode."""
+    return _css(_get_pygments_css(mode))
+
+
+def _base_stylesheets(body_html: str) -> list[CSS]:
+    """Return the base stylesheet modules needed to render ``body_html``."""
+    sheets = [_css(_CSS_CORE)]
+    for marker, stylesheet in _OPTIONAL_CSS:
+        if marker.search(body_html):
+            sheets.append(_css(stylesheet))
+    return sheets
+
+
+def _read_markdown(path: Path) -> str:
+    """Read a UTF-8 Markdown file by decoding straight from a memory map.
+
+    This skips the intermediate ``bytes`` copy that ``read_text`` makes.
+    Pipes, FIFOs, empty files and files on filesystems without mmap support
+    are read normally. Line endings are left as-is; Markdown normalizes them
+    itself.
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # e.g. ENODEV on some FUSE and network mounts
+            else:
+                with mm:
+                    return str(mm, "utf-8")
+        return f.read().decode("utf-8")
+
+
+# HTML comments and scripts have no effect on the PDF; dropping them up front
+# keeps WeasyPrint's HTML parser from walking them.
+_STRIP_RE = re.compile(r"<!--.*?-->|<script\b[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+
+
+# The fixed parts of the HTML scaffold, pre-encoded once.
+_HEAD_PREFIX = b'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+_BODY_OPEN = b"</head>\n<body>\n"
+_BODY_CLOSE = b"\n</body>\n</html>"
+
+
+def _build_html(body_html: str, size: str, margin: float) -> bytes:
+    """Assemble a complete UTF-8 HTML document around the rendered body.
+
+    Only the ``@page`` rule is inlined; the remaining styles are passed to
+    WeasyPrint as pre-parsed stylesheets. Bytes are returned because
+    WeasyPrint wraps str input in a StringIO, which stores a wide-character
+    copy, while bytes go through a BytesIO that shares the buffer.
+    """
+    page_css = f"<style>@page {{ size: {_PAGE_SIZE[size]}; margin: {margin}in; }}</style>\n"
+    return b"".join([
+        _HEAD_PREFIX,
+        page_css.encode("utf-8"),
+        _BODY_OPEN,
+        body_html.encode("utf-8"),
+        _BODY_CLOSE,
+    ])
 
 
 # ---------------------------------------------------------------------------
@@ -391,53 +570,199 @@ def _build_html(body_html: str, pygments_css: str, mode: str, size: str, margin:
 
 def convert(
     input_path: str | Path,
-    output_path: str | Path,
+    output_path: str | Path | None = None,
     *,
     mode: str = "LIGHT",
     size: str = "LETTER",
     margin: float = 0.5,
-) -> None:
+    highlight: bool = True,
+    guess_lang: bool = False,
+    optimize: bool = True,
+    as_bytes: bool = False,
+    image_cache: dict | None = None,
+    font_config: FontConfiguration | None = None,
+) -> bytes | None:
     """Convert a Markdown file to PDF.
 
     Args:
         input_path: Path to the source .md file.
-        output_path: Path to write the output .pdf file.
+        output_path: Path to write the output .pdf file (default: same name
+            as the input with a .pdf extension). Must be omitted when
+            ``as_bytes`` is set.
         mode: Color mode — "LIGHT" (default) or "DARK".
         size: Page size — "LETTER" (default) or "A4".
         margin: Page margin in inches (default: 0.5).
+        highlight: Syntax-highlight fenced code blocks with Pygments
+            (default: True). Disabling it speeds up code-heavy documents.
+        guess_lang: Guess the language of code blocks without one when
+            highlighting (default: False). This tries every Pygments lexer
+            on each unlabeled block.
+        optimize: Losslessly recompress embedded images to shrink the PDF
+            (default: True). Fonts are always subset.
+        as_bytes: Return the PDF instead of writing it to disk (default:
+            False). Useful when the caller streams the PDF elsewhere.
+        image_cache: Dict in which WeasyPrint keeps decoded images, keyed by
+            URL, so conversions sharing it decode each image only once
+            (default: None, a fresh cache per call). Entries are never
+            refreshed or evicted, and each keeps the ``optimize`` setting it
+            was decoded with.
+        font_config: WeasyPrint font configuration to reuse, so conversions
+            sharing it register the bundled fonts only once (default: None, a
+            fresh configuration per call). Any ``@font-face`` rules in a
+            document stay registered for later documents using the same
+            configuration, and it must not be used by two threads at once.
+
+    Returns:
+        The PDF as bytes if ``as_bytes`` is set, otherwise None.
+
+    Raises:
+        ValueError: If ``mode`` or ``size`` is not a supported value, or if
+            both ``output_path`` and ``as_bytes`` are given.
+        FileNotFoundError: If ``input_path`` does not exist.
     """
+    if mode not in _THEME_CSS:
+        raise ValueError(f"Unknown mode: {mode!r} (expected one of {', '.join(_THEME_CSS)})")
+    if size not in _PAGE_SIZE:
+        raise ValueError(f"Unknown size: {size!r} (expected one of {', '.join(_PAGE_SIZE)})")
+    if as_bytes and output_path is not None:
+        raise ValueError("output_path cannot be used together with as_bytes")
+
     input_path = Path(input_path)
+    if output_path is None:
+        output_path = input_path.with_suffix(".pdf")
     output_path = Path(output_path)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    md_text = input_path.read_text(encoding="utf-8")
+    from weasyprint import HTML
+    from weasyprint.text.fonts import FontConfiguration
 
-    md = markdown.Markdown(
-        extensions=_MARKDOWN_EXTENSIONS,
-        extension_configs=_MARKDOWN_EXTENSION_CONFIGS,
-    )
-    body_html = md.convert(md_text)
+    if font_config is None:
+        font_config = FontConfiguration()
 
-    pygments_css = _get_pygments_css(mode)
-    full_html = _build_html(body_html, pygments_css, mode, size, margin)
+    md_text = _read_markdown(input_path)
 
-    font_config = FontConfiguration()
-    font_css = CSS(string=_font_face_css(), font_config=font_config)
-    HTML(
-        string=full_html,
+    md = _get_markdown(highlight, guess_lang)
+    md.reset()
+    body_html = md.convert(md_text)
+    body_html = _STRIP_RE.sub("", body_html)
+
+    html_bytes = _build_html(body_html, size, margin)
+
+    # WeasyPrint applies stylesheets= as user-origin CSS, which ranks below
+    # author CSS. Raw <style> blocks or style= attributes in the Markdown
+    # therefore override these defaults whatever the selector specificity
+    # (e.g. `pre { padding: 0 }` beats `.codehilite pre`). This is deliberate:
+    # it lets the built-in styles be parsed once and reused, and documents'
+    # own styling takes precedence.
+    theme_css = _css(_THEME_CSS[mode])
+    stylesheets = [*_base_stylesheets(body_html), theme_css]
+    # Highlighting rules are only needed when codehilite produced a block.
+    if highlight and "codehilite" in body_html:
+        stylesheets.append(_pygments_css_obj(mode))
+    stylesheets.append(_font_css(font_config))
+    # With no target, write_pdf() renders into an in-memory buffer and
+    # returns its contents instead of writing a file.
+    return HTML(
+        string=html_bytes,
+        encoding="utf-8",
         base_url=str(input_path.parent),
-    ).write_pdf(str(output_path), stylesheets=[font_css], font_config=font_config)
+    ).write_pdf(
+        None if as_bytes else str(output_path),
+        stylesheets=stylesheets,
+        font_config=font_config,
+        optimize_images=optimize,
+        cache=image_cache,
+    )
 
 
 # ---------------------------------------------------------------------------
 # CLI entry point
 # ---------------------------------------------------------------------------
 
-def main() -> None:
+def _silence_weasyprint() -> None:
     logging.getLogger("weasyprint").setLevel(logging.ERROR)
 
+
+@functools.cache
+def _worker_font_config() -> FontConfiguration:
+    """Return the font configuration shared by the files one batch worker converts.
+
+    Fontconfig initialization is expensive, and registering the bundled fonts
+    copies them into a temporary folder, so a worker only does this once.
+    """
+    from weasyprint.text.fonts import FontConfiguration
+
+    return FontConfiguration()
+
+
+def _remove_font_folder() -> None:
+    """Delete the temporary folder holding the worker configuration's fonts."""
+    if _worker_font_config.cache_info().currsize:
+        folder = getattr(_worker_font_config(), "_folder", None)
+        if folder:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+def _init_worker() -> None:
+    _silence_weasyprint()
+    # Pool workers end with os._exit(), so FontConfiguration.__del__ never
+    # runs and its copy of the bundled fonts would be left in the temp dir.
+    # multiprocessing runs registered finalizers before a worker exits.
+    multiprocessing.util.Finalize(None, _remove_font_folder, exitpriority=0)
+
+
+@functools.cache
+def _worker_image_cache() -> dict:
+    """Return the image cache shared by the files one batch worker converts.
+
+    All files in a batch use the same options, and the worker exits when the
+    batch ends, so its cache cannot go stale or grow without bound.
+    """
+    return {}
+
+
+def _convert_in_worker(input_path: Path, **options) -> None:
+    convert(
+        input_path,
+        input_path.with_suffix(".pdf"),
+        image_cache=_worker_image_cache(),
+        font_config=_worker_font_config(),
+        **options,
+    )
+
+
+def _convert_many(input_paths: list[Path], **options) -> bool:
+    """Convert several files in parallel, writing each PDF next to its input.
+
+    Each worker process keeps its own parser, stylesheet, font and image
+    caches, so only the first file a worker handles pays the setup cost.
+    Returns True if every conversion succeeded.
+    """
+    ok = True
+    workers = min(len(input_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            (pool.submit(_convert_in_worker, path, **options), path)
+            for path in input_paths
+        ]
+        for future, path in futures:
+            try:
+                future.result()
+                print(f"PDF written to: {path.with_suffix('.pdf')}", file=sys.stderr)
+            except FileNotFoundError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                ok = False
+            except Exception as e:
+                print(f"Conversion failed for {path}: {e}", file=sys.stderr)
+                ok = False
+    return ok
+
+
+def main() -> None:
+    _silence_weasyprint()
+
     parser = argparse.ArgumentParser(
         prog="md-pdf",
         description="Convert Markdown to PDF with GitHub-like rendering.",
@@ -445,23 +770,25 @@ def main() -> None:
     parser.add_argument(
         "input",
         metavar="FILE",
-        help="Path to the Markdown file to convert",
+        nargs="+",
+        help="Path to the Markdown file(s) to convert; several files are converted in parallel",
     )
     parser.add_argument(
         "--output", "-o",
         metavar="OUTPUT",
         default=None,
-        help="Output PDF path (default: same name as input with .pdf extension)",
+        help="Output PDF path (default: same name as input with .pdf extension; "
+        "single input only)",
     )
     parser.add_argument(
         "--size",
-        choices=["LETTER", "A4"],
+        choices=list(_PAGE_SIZE),
         default="LETTER",
         help="Page size (default: LETTER)",
     )
     parser.add_argument(
         "--mode",
-        choices=["LIGHT", "DARK"],
+        choices=list(_THEME_CSS),
         default="LIGHT",
         help="Color mode (default: LIGHT)",
     )
@@ -473,13 +800,56 @@ def main() -> None:
         help="Page margin in inches (default: 0.5)",
     )
 
+    parser.add_argument(
+        "--no-highlight",
+        dest="highlight",
+        action="store_false",
+        help="Disable syntax highlighting of code blocks (faster for code-heavy files)",
+    )
+    parser.add_argument(
+        "--guess-lang",
+        action="store_true",
+        help="Guess the language of code blocks that do not specify one (slower)",
+    )
+
     args = parser.parse_args()
 
-    input_path = Path(args.input)
+    if args.output and len(args.input) > 1:
+        parser.error("--output can only be used with a single input file")
+
+    if len(args.input) > 1:
+        # Two workers must never write the same PDF: the same file named
+        # twice is converted once, and distinct inputs sharing an output
+        # (e.g. notes.md and notes.markdown) are rejected.
+        inputs_by_output: dict[Path, Path] = {}
+        for path in map(Path, args.input):
+            output = path.with_suffix(".pdf").resolve()
+            previous = inputs_by_output.setdefault(output, path)
+            if previous.resolve() != path.resolve():
+                parser.error(f"{previous} and {path} would both be written to {output}")
+        ok = _convert_many(
+            list(inputs_by_output.values()),
+            mode=args.mode,
+            size=args.size,
+            margin=args.margin,
+            highlight=args.highlight,
+            guess_lang=args.guess_lang,
+        )
+        sys.exit(0 if ok else 1)
+
+    input_path = Path(args.input[0])
     output_path = Path(args.output) if args.output else input_path.with_suffix(".pdf")
 
     try:
-        convert(input_path, output_path, mode=args.mode, size=args.size, margin=args.margin)
+        convert(
+            input_path,
+            output_path,
+            mode=args.mode,
+            size=args.size,
+            margin=args.margin,
+            highlight=args.highlight,
+            guess_lang=args.guess_lang,
+        )
         print(f"PDF written to: {output_path}", file=sys.stderr)
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)